@@ -0,0 +1,31 @@
+"""
+build_native.py
+
+Ahead-of-time compile the Scrabble scoring loop into a standalone
+`scrabble_native` extension module. When the built extension is present
+on the path, scrabble_game imports it instead of JIT-compiling the loop,
+so the game pays no compile latency at startup.
+
+Usage: python build_native.py
+"""
+from numba.pycc import CC
+
+cc = CC('scrabble_native')
+
+# Masking an ASCII byte with 0xDF clears bit 5, which uppercases letters
+ASCII_UPPER_MASK = 0xDF
+
+
+@cc.export('score', 'i8(u1[:], u1[:])')
+def score(buf, lut):
+    """
+    Sum the lookup-table values for a uint8 word buffer.
+    """
+    total = 0
+    for i in range(buf.size):
+        total += lut[buf[i] & ASCII_UPPER_MASK]
+    return total
+
+
+if __name__ == '__main__':
+    cc.compile()
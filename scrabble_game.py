@@ -7,13 +7,118 @@ The game includes features like time limits, input validation,
 word verification, and scoring bonuses based on speed.
 """
 import tkinter as tk
+import re
 import time
 import random
-from threading import Thread, Event
-from spellchecker import SpellChecker
+from functools import lru_cache
+from threading import Lock, Thread
+from types import MappingProxyType
+import numpy as np
 
-# Initialize the SpellChecker
-spell = SpellChecker()
+# Numba is optional; scoring falls back to pure Python without it
+try:
+    from numba import njit, vectorize
+except ImportError:
+    njit = None
+    vectorize = None
+
+# Dictionary words bucketed by length, built lazily on the first
+# validity check so importing this module does not pay the SpellChecker
+# load time. Rounds always ask for a specific length, so bucketing lets
+# wrong-length words be rejected without hashing against the full set.
+# The game also warms the load in a background thread (see
+# ScrabbleGame.__init__), so the lock keeps the build single-shot.
+_WORDS_BY_LEN = None
+_WORDS_LOCK = Lock()
+
+
+def _load_words():
+    """
+    Build the length-bucketed dictionary on first use and return it.
+    """
+    global _WORDS_BY_LEN
+    if _WORDS_BY_LEN is None:
+        with _WORDS_LOCK:
+            if _WORDS_BY_LEN is None:
+                from spellchecker import SpellChecker
+                by_len = {}
+                for word in SpellChecker().word_frequency.dictionary:
+                    by_len.setdefault(len(word), set()).add(word)
+                _WORDS_BY_LEN = {
+                    length: frozenset(words)
+                    for length, words in by_len.items()}
+    return _WORDS_BY_LEN
+
+
+# Scrabble letter values, shared read-only across the module
+_LETTER_VALUES = MappingProxyType({
+    'A': 1, 'E': 1, 'I': 1, 'O': 1, 'U': 1,
+    'L': 1, 'N': 1, 'R': 1, 'S': 1, 'T': 1,
+    'D': 2, 'G': 2,
+    'B': 3, 'C': 3, 'M': 3, 'P': 3,
+    'F': 4, 'H': 4, 'V': 4, 'W': 4, 'Y': 4,
+    'K': 5,
+    'J': 8, 'X': 8,
+    'Q': 10, 'Z': 10
+})
+# Masking an ASCII byte with 0xDF clears bit 5, which uppercases letters,
+# so 'a' and 'A' share the same table entry.
+_ASCII_UPPER_MASK = 0xDF
+# 256-entry lookup table mapping each (masked) ASCII byte to its score
+_SCORE_LUT = bytes(
+    _LETTER_VALUES.get(chr(i & _ASCII_UPPER_MASK), 0) for i in range(256)
+)
+# NumPy view of the lookup table, widened so batch sums cannot overflow
+_SCORE_LUT_NP = np.frombuffer(_SCORE_LUT, dtype=np.uint8).astype(np.intp)
+_SCORE_LUT_U8 = np.frombuffer(_SCORE_LUT, dtype=np.uint8)
+
+# Prefer the AOT-compiled extension produced by build_native.py, which
+# needs no warmup; fall back to JIT compilation, then pure Python
+try:
+    from scrabble_native import score as _score_bytes
+except ImportError:
+    if njit is not None:
+        @njit(cache=True)
+        def _score_bytes(buf, lut):
+            """
+            Sum the table values for a uint8 buffer in a compiled loop.
+            """
+            total = 0
+            for i in range(buf.size):
+                total += lut[buf[i] & _ASCII_UPPER_MASK]
+            return total
+
+        # Warm the JIT at import so the first round does not stall
+        _score_bytes(np.zeros(1, dtype=np.uint8), _SCORE_LUT_U8)
+    else:
+        _score_bytes = None
+
+if vectorize is not None:
+    @vectorize(['uint8(uint8)'], nopython=True, cache=True)
+    def score_char(byte):
+        """
+        Score a single ASCII byte through the lookup table.
+
+        Being a ufunc, this broadcasts over whole uint8 arrays, so large
+        word corpora can be scored as score_char(arr).sum() slices.
+        """
+        return _SCORE_LUT_U8[byte & _ASCII_UPPER_MASK]
+else:
+    score_char = None
+
+
+@lru_cache(maxsize=1024)
+def _score_word(word):
+    """
+    Score an uppercase word, caching the result per distinct word.
+    """
+    encoded = word.encode('ascii', 'ignore')
+    if _score_bytes is not None:
+        return int(_score_bytes(
+            np.frombuffer(encoded, dtype=np.uint8), _SCORE_LUT_U8))
+    # The table already folds in the uppercase mask, so translating the
+    # bytes through it and summing runs entirely in C
+    return sum(encoded.translate(_SCORE_LUT))
 
 
 # Calculate Scrabble score
@@ -21,17 +126,41 @@ def calculate_score(word):
     """
     Calculate the Scrabble score of a given word based on letter values.
     """
-    letter_values = {
-        'A': 1, 'E': 1, 'I': 1, 'O': 1, 'U': 1,
-        'L': 1, 'N': 1, 'R': 1, 'S': 1, 'T': 1,
-        'D': 2, 'G': 2,
-        'B': 3, 'C': 3, 'M': 3, 'P': 3,
-        'F': 4, 'H': 4, 'V': 4, 'W': 4, 'Y': 4,
-        'K': 5,
-        'J': 8, 'X': 8,
-        'Q': 10, 'Z': 10
-    }
-    return sum(letter_values.get(letter.upper(), 0) for letter in word)
+    return _score_word(word.upper())
+
+
+# Calculate Scrabble scores for a batch of words
+def calculate_scores(words):
+    """
+    Calculate the Scrabble scores of a list of words in one pass.
+
+    The words are concatenated into a single byte buffer, scored through
+    the lookup table as a NumPy array, and summed per word with a
+    segmented reduction, avoiding per-word Python overhead.
+    """
+    encoded = [word.encode('ascii', 'ignore') for word in words]
+    lengths = np.array([len(piece) for piece in encoded], dtype=np.intp)
+    # Zero-length words would give reduceat repeated or out-of-range
+    # offsets, so reduce only the non-empty segments and leave the
+    # empty ones at their zero score
+    scores = np.zeros(len(encoded), dtype=np.intp)
+    nonempty = lengths > 0
+    if nonempty.any():
+        joined = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        values = _SCORE_LUT_NP[joined & _ASCII_UPPER_MASK]
+        counts = lengths[nonempty]
+        offsets = np.concatenate(([0], np.cumsum(counts[:-1])))
+        scores[nonempty] = np.add.reduceat(values, offsets)
+    return scores
+
+
+@lru_cache(maxsize=8192)
+def _is_known_word(word):
+    """
+    Check a lowercase word against the dictionary, caching the result.
+    """
+    bucket = _load_words().get(len(word))
+    return bucket is not None and word in bucket
 
 
 # Check if the word is valid
@@ -39,7 +168,16 @@ def is_valid_word(word):
     """
     Check if the input word is valid by verifying it in the dictionary.
     """
-    return word.lower() in spell
+    return _is_known_word(word.lower())
+
+
+# Scrabble only accepts ASCII letters; a precompiled fullmatch avoids
+# the Unicode category walk of str.isalpha and rejects accented letters
+# that the score table would silently count as zero
+_ALPHA = re.compile(r'[A-Za-z]+').fullmatch
+
+# Bonus points indexed by elapsed seconds (0-15)
+_TIME_BONUS = (20, 20, 20, 20, 20, 20, 10, 10, 10, 10, 10, 5, 5, 5, 5, 5)
 
 
 # Calculate the bonus based on time
@@ -50,12 +188,8 @@ def calculate_time_bonus(elapsed_time):
         6 to 10 seconds:        10 bonus points.
         11 to 15 seconds:       5 bonus points.
     """
-    if elapsed_time <= 5:
-        return 20
-    if elapsed_time <= 10:
-        return 10
-    if elapsed_time <= 15:
-        return 5
+    if 0 <= elapsed_time <= 15:
+        return _TIME_BONUS[int(elapsed_time)]
     return 0
 
 
@@ -63,6 +197,12 @@ class ScrabbleGame:
     """
     ScrabbleGame class handles the main logic and GUI for the Scrabble game.
     """
+    # Prompt and warning strings precomputed for each round length
+    _LEN_PROMPTS = {
+        n: f"Enter a word with exactly {n} letters" for n in range(3, 8)}
+    _LEN_ERRORS = {
+        n: f"Word must be exactly {n} letters long." for n in range(3, 8)}
+
     def __init__(self, game_root):
         self.root = game_root
         self.root.title("Scrabble Game")
@@ -74,53 +214,66 @@ class ScrabbleGame:
         self.total_score = 0
         self.current_round = 0
         self.max_rounds = 10
+        # Draw every round's required length up front in one RNG call;
+        # seeding random makes a whole game reproducible
+        self._lengths = random.choices(range(3, 8), k=self.max_rounds)
         self.timer_running = False
-        self.stop_event = Event()
-        self.timer_thread = None
+        self._remaining = 15
+        self._tick_id = None
+        self._round_start = 0.0
+        self.final_score_label = None
+        # Warm the dictionary in the background while the GUI builds,
+        # so the first submit does not block on the SpellChecker load
+        Thread(target=_load_words, daemon=True).start()
         # Setup GUI elements
         self.setup_gui()
 
     def setup_gui(self):
         """
         Set up the GUI elements for the Scrabble game.
+
+        All gameplay widgets live in a single frame so screen
+        transitions can hide or show them with one call.
         """
+        self.game_frame = tk.Frame(self.root)
+        self.game_frame.pack(fill=tk.BOTH, expand=True)
         # Round and score display
         self.round_label = tk.Label(
-            self.root,
+            self.game_frame,
             text=f"Round: {self.current_round + 1}/{self.max_rounds}",
             font=("Arial", 14))
         self.round_label.pack(pady=10)
         self.score_label = tk.Label(
-            self.root,
+            self.game_frame,
             text=f"Score: {self.total_score}",
             font=("Arial", 17))
         self.score_label.pack(pady=10)
         self.timer_label = tk.Label(
-            self.root,
+            self.game_frame,
             text="Time remaining: 15 seconds",
             font=("Arial", 14), fg="red")
         self.timer_label.pack(pady=10)
         self.required_length_label = tk.Label(
-            self.root,
+            self.game_frame,
             text="Enter a word with exactly X letters",
             font=("Arial", 14))
         self.required_length_label.pack(pady=10)
         # Warning label
         self.warning_label = tk.Label(
-            self.root,
+            self.game_frame,
             text="",
             font=("Arial", 17), fg="red")
         self.warning_label.pack(pady=10)
         # Entry and buttons
-        self.entry = tk.Entry(self.root, font=("Arial", 14))
+        self.entry = tk.Entry(self.game_frame, font=("Arial", 14))
         self.entry.pack(pady=10)
         self.submit_button = tk.Button(
-            self.root,
+            self.game_frame,
             text="Submit", command=self.check_word,
             font=("Arial", 14))
         self.submit_button.pack(pady=10)
         self.quit_button = tk.Button(
-            self.root,
+            self.game_frame,
             text="Quit",
             command=self.quit_game,
             font=("Arial", 14))
@@ -136,17 +289,14 @@ class ScrabbleGame:
             self.current_round += 1
             self.round_label.config(
                 text=f"Round: {self.current_round}/{self.max_rounds}")
-            self.required_length = random.randint(3, 7)
+            self.required_length = self._lengths[self.current_round - 1]
             self.entry.delete(0, tk.END)
             self.required_length_label.config(
-                text=(
-                    f"Enter a word with exactly {self.required_length} "
-                    "letters"
-                )
-            )
+                text=self._LEN_PROMPTS[self.required_length])
             # Clear any previous warnings
             self.warning_label.config(text="")
             # Start the timer
+            self._round_start = time.monotonic()
             self.start_timer()
         else:
             # Show final screen after the last round
@@ -156,25 +306,29 @@ class ScrabbleGame:
         """
         Start the countdown timer for each round.
         """
-        if self.timer_running and self.timer_thread:
-            self.stop_event.set()
-            self.timer_thread.join()
-        self.stop_event.clear()
+        self.cancel_timer()
         self.timer_running = True
-        self.timer_thread = Thread(target=self.countdown_timer)
-        self.timer_thread.start()
+        self._remaining = 15
+        self._tick()
 
-    def countdown_timer(self):
+    def cancel_timer(self):
+        """
+        Cancel any pending countdown tick.
         """
-        Countdown function that updates the timer each second.
+        if self._tick_id is not None:
+            self.root.after_cancel(self._tick_id)
+            self._tick_id = None
+
+    def _tick(self):
         """
-        for remaining in range(15, 0, -1):
-            if self.stop_event.is_set():
-                break
-            self.update_timer_display(remaining)
-            time.sleep(1)
-        if not self.stop_event.is_set():
-            self.update_timer_display(0)
+        Update the countdown each second on the Tk event loop.
+        """
+        self.update_timer_display(self._remaining)
+        if self._remaining > 0:
+            self._remaining -= 1
+            self._tick_id = self.root.after(1000, self._tick)
+        else:
+            self._tick_id = None
             # Show "Time's up!"
             self.warning_label.config(text="Time's up!")
             # Wait a moment before starting a new round
@@ -182,13 +336,9 @@ class ScrabbleGame:
 
     def update_timer_display(self, remaining):
         """
-        Update the timer label text in the main thread.
+        Update the timer label text.
         """
-        self.root.after(
-            0,
-            lambda: self.timer_label.config(
-                text=f"Time remaining: {remaining} seconds")
-        )
+        self.timer_label.config(text=f"Time remaining: {remaining} seconds")
 
     def check_word(self):
         """
@@ -198,23 +348,26 @@ class ScrabbleGame:
         if not self.timer_running:
             return
         user_input = self.entry.get().strip()
-        if not user_input.isalpha():
+        if not _ALPHA(user_input):
             self.show_warning("Please enter only alphabetic characters.")
             return
         if len(user_input) != self.required_length:
-            self.show_warning(
-                f"Word must be exactly {self.required_length} letters long.")
+            self.show_warning(self._LEN_ERRORS[self.required_length])
             return
-        if not is_valid_word(user_input):
+        # Case-fold once and reuse for validation and scoring
+        word = user_input.lower()
+        if not _is_known_word(word):
             self.show_warning("The word is not in the dictionary.")
             return
-        elapsed_time = 15 - int(self.timer_label.cget("text").split()[2])
-        base_score = calculate_score(user_input)
+        elapsed_time = int(time.monotonic() - self._round_start)
+        base_score = calculate_score(word)
         time_bonus = calculate_time_bonus(elapsed_time)
         round_score = base_score + time_bonus
         self.total_score += round_score
         self.score_label.config(text=f"Score: {self.total_score}")
         self.warning_label.config(text="")  # Clear any previous warnings
+        # Stop the countdown while the score is displayed
+        self.cancel_timer()
         # Show score and bonus before moving to the next round
         self.show_score(base_score, time_bonus)
 
@@ -232,16 +385,14 @@ class ScrabbleGame:
         """
         Display the final score.
         """
-        # Hide existing widgets
-        for widget in self.root.winfo_children():
-            widget.pack_forget()
-
+        # Hide the gameplay widgets with a single call
+        self.game_frame.pack_forget()
         # Show final score
-        final_score_label = tk.Label(
+        self.final_score_label = tk.Label(
             self.root,
             text=f"Total Score: {self.total_score}",
             font=("Arial", 40))
-        final_score_label.pack(pady=20, expand=True)  # Center horizontally
+        self.final_score_label.pack(pady=20, expand=True)
 
     def show_warning(self, message):
         """
@@ -252,30 +403,35 @@ class ScrabbleGame:
     def reset_game(self):
         """
         Reset the game state and start a new game.
+
+        The existing widgets are reused; only their text is updated.
         """
         # Reset the game state
         self.total_score = 0
         self.current_round = 0
-        # Clear the GUI
-        for widget in self.root.winfo_children():
-            widget.pack_forget()
-        # Setup GUI and start a new round
-        self.setup_gui()
+        self._lengths = random.choices(range(3, 8), k=self.max_rounds)
+        # Remove the end screen if showing and bring the gameplay
+        # widgets back with a single call
+        if self.final_score_label is not None:
+            self.final_score_label.destroy()
+            self.final_score_label = None
+            self.game_frame.pack(fill=tk.BOTH, expand=True)
+        self.score_label.config(text="Score: 0")
+        self.warning_label.config(text="")
         self.start_round()
 
     def quit_game(self):
         """
         Show the final score and quit the game after 2 seconds.
         """
-        # Hide existing widgets
-        for widget in self.root.winfo_children():
-            widget.pack_forget()
+        # Hide the gameplay widgets with a single call
+        self.game_frame.pack_forget()
         # Show final score
-        final_score_label = tk.Label(
+        self.final_score_label = tk.Label(
             self.root,
             text=f"Total Score: {self.total_score}",
             font=("Arial", 40))
-        final_score_label.pack(pady=20, expand=True)  # Center horizontally
+        self.final_score_label.pack(pady=20, expand=True)
         # Wait 2 seconds and then quit the game
         self.root.after(2000, self.root.quit)
 
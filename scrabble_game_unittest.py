@@ -6,11 +6,11 @@ Tests include score calculation, case insensitivity, input validation,
 word length check, dictionary validation, and timer-based scoring.
 """
 
+import time
 import unittest
-from unittest.mock import patch
 from tkinter import Tk, Label, Entry
 
-from scrabble_game import calculate_score, ScrabbleGame
+from scrabble_game import calculate_score, calculate_scores, ScrabbleGame
 
 
 class TestScrabbleGame(unittest.TestCase):
@@ -53,6 +53,21 @@ class TestScrabbleGame(unittest.TestCase):
         self.assertEqual(calculate_score('apple'), 9)
         self.assertEqual(calculate_score('orange'), 7)
 
+    def test_calculate_scores_batch(self):
+        """
+        Test the calculate_scores function with a batch of words.
+        Verifies that batch scoring matches calculate_score word by word
+        and that empty words and empty batches score as zero.
+        """
+        words = ['apple', 'orange', 'cabbage']
+        self.assertEqual(
+            list(calculate_scores(words)),
+            [calculate_score(word) for word in words])
+        self.assertEqual(list(calculate_scores(['a', '', 'b'])), [1, 0, 3])
+        self.assertEqual(list(calculate_scores(['ab', ''])), [4, 0])
+        self.assertEqual(list(calculate_scores([''])), [0])
+        self.assertEqual(len(calculate_scores([])), 0)
+
     def test_upper_lower_case(self):
         """
         Test case insensitivity of the calculate_score function.
@@ -125,46 +140,43 @@ class TestScrabbleGame(unittest.TestCase):
             self.game.warning_label.cget('text'),
             "The word is not in the dictionary.")
 
-    @patch('scrabble_game.time.sleep', return_value=None)
-    def test_timer_and_score_bonus_5(self, _):
+    def test_timer_and_score_bonus_5(self):
         """
         Test the timer and score bonus functionality.
-        Mocks the sleep function to avoid delays and checks that the correct
-        score and bonus are displayed based on the time remaining.
+        Checks that the correct score and bonus are displayed
+        based on the elapsed time.
         """
         self.game.required_length = 7
         self.game.entry.insert(0, 'cabbage')
-        self.game.timer_label.config(text="Time remaining: 4 seconds")
+        self.game._round_start = time.monotonic() - 11
         self.game.check_word()
         self.assertIn(
             "Score: 14 (Bonus: 5)",
             self.game.warning_label.cget('text'))
 
-    @patch('scrabble_game.time.sleep', return_value=None)
-    def test_timer_and_score_bonus_10(self, _):
+    def test_timer_and_score_bonus_10(self):
         """
         Test the timer and score bonus functionality.
-        Mocks the sleep function to avoid delays and checks that the correct
-        score and bonus are displayed based on the time remaining.
+        Checks that the correct score and bonus are displayed
+        based on the elapsed time.
         """
         self.game.required_length = 7
         self.game.entry.insert(0, 'cabbage')
-        self.game.timer_label.config(text="Time remaining: 7 seconds")
+        self.game._round_start = time.monotonic() - 8
         self.game.check_word()
         self.assertIn(
             "Score: 14 (Bonus: 10)",
             self.game.warning_label.cget('text'))
 
-    @patch('scrabble_game.time.sleep', return_value=None)
-    def test_timer_and_score_bonus_20(self, _):
+    def test_timer_and_score_bonus_20(self):
         """
         Test the timer and score bonus functionality.
-        Mocks the sleep function to avoid delays and checks that the correct
-        score and bonus are displayed based on the time remaining.
+        Checks that the correct score and bonus are displayed
+        based on the elapsed time.
         """
         self.game.required_length = 7
         self.game.entry.insert(0, 'cabbage')
-        self.game.timer_label.config(text="Time remaining: 12 seconds")
+        self.game._round_start = time.monotonic() - 3
         self.game.check_word()
         self.assertIn(
             "Score: 14 (Bonus: 20)",